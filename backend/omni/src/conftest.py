@@ -0,0 +1,17 @@
+"""Shared pytest configuration for the backend test suite."""
+
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+# Load backend/omni/.env once per test run (once per xdist worker) so test
+# modules can read UNIT_TEST_* variables at import time without each of them
+# searching for the file again.
+load_dotenv(Path(__file__).resolve().parents[1] / ".env")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run all ``@pytest.mark.anyio`` tests on the asyncio backend only."""
+    return "asyncio"
@@ -1,6 +1,7 @@
 import hashlib
 import hmac as hmac_module
 import time
+from collections.abc import Iterator
 from urllib.parse import parse_qs, urlparse
 
 import jwt
@@ -73,6 +74,23 @@ def _build_client(module: OIDCAuthModule) -> TestClient:
     return TestClient(app, follow_redirects=False)
 
 
+@pytest.fixture(scope="module")
+def shared_client() -> Iterator[TestClient]:
+    """One app and client per module for tests that never contact the IdP.
+
+    Entering the client keeps a single event-loop portal open for the whole
+    module instead of starting one per request.
+    """
+    with _build_client(_build_module()) as client:
+        yield client
+
+
+@pytest.fixture
+def client(shared_client: TestClient) -> TestClient:
+    shared_client.cookies.clear()
+    return shared_client
+
+
 def _make_csrf_token(session_cookie: str, secret: str = SESSION_SECRET) -> str:
     """Derive the CSRF token the same way the module does."""
     return hmac_module.new(
@@ -188,25 +206,19 @@ class TestLogin:
 
 
 class TestCallback:
-    def test_callback_error_parameter(self):
-        module = _build_module()
-        client = _build_client(module)
-
-        resp = client.get("/api/auth/callback?error=access_denied")
-        assert resp.status_code == 400
-
-    def test_callback_missing_code(self):
-        module = _build_module()
-        client = _build_client(module)
-
-        resp = client.get("/api/auth/callback?state=abc")
-        assert resp.status_code == 400
-
-    def test_callback_missing_state(self):
-        module = _build_module()
-        client = _build_client(module)
-
-        resp = client.get("/api/auth/callback?code=xyz")
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "error=access_denied",
+            "state=abc",
+            "code=xyz",
+            # No prior login, so Authlib raises MismatchingStateError
+            "code=xyz&state=abc",
+        ],
+        ids=["error", "missing_code", "missing_state", "no_auth_state_cookie"],
+    )
+    def test_callback_rejects_bad_request(self, client, query):
+        resp = client.get(f"/api/auth/callback?{query}")
         assert resp.status_code == 400
 
     def test_callback_invalid_state(self, httpserver):
@@ -219,14 +231,6 @@ class TestCallback:
         resp = client.get("/api/auth/callback?code=xyz&state=wrong-state")
         assert resp.status_code == 400
 
-    def test_callback_missing_auth_state_cookie(self):
-        """Calling callback without a prior login raises MismatchingStateError -> 400."""
-        module = _build_module()
-        client = _build_client(module)
-
-        resp = client.get("/api/auth/callback?code=xyz&state=abc")
-        assert resp.status_code == 400
-
     def test_callback_success(self, httpserver):
         module = _build_module_with_server(httpserver)
         client = _build_client(module)
@@ -309,10 +313,7 @@ class TestLogout:
         assert "end_session" in body["redirect_url"]
         assert f"client_id={CLIENT_ID}" in body["redirect_url"]
 
-    def test_logout_without_session(self):
-        module = _build_module()
-        client = _build_client(module)
-
+    def test_logout_without_session(self, client):
         resp = client.post("/api/auth/logout")
         assert resp.status_code == 401
 
@@ -359,25 +360,16 @@ class TestLogout:
         assert resp.status_code == 200
         assert resp.json()["redirect_url"] == POST_LOGOUT_URI
 
-    def test_logout_with_expired_cookie(self, httpserver):
-        """Expired cookies are cleared and the user receives a redirect URL."""
-        module = _build_module_with_server(httpserver)
-        client = _build_client(module)
-
-        cookie = _make_session_cookie(expires_delta=-60)
-        client.cookies.set(COOKIE_NAME, cookie)
-        csrf = _make_csrf_token(cookie)
-
-        resp = client.post("/api/auth/logout", headers={"X-CSRF-Token": csrf})
-        assert resp.status_code == 200
-        assert "redirect_url" in resp.json()
-
-    def test_logout_with_tampered_cookie(self, httpserver):
-        """Tampered cookies are cleared and the user receives a redirect URL."""
+    @pytest.mark.parametrize(
+        "cookie",
+        [_make_session_cookie(expires_delta=-60), "garbage.token.here"],
+        ids=["expired", "tampered"],
+    )
+    def test_logout_with_unusable_cookie(self, httpserver, cookie):
+        """Expired or tampered cookies are cleared and the user receives a redirect URL."""
         module = _build_module_with_server(httpserver)
         client = _build_client(module)
 
-        cookie = "garbage.token.here"
         client.cookies.set(COOKIE_NAME, cookie)
         csrf = _make_csrf_token(cookie)
 
@@ -390,10 +382,7 @@ class TestLogout:
 
 
 class TestCsrf:
-    def test_csrf_returns_token_for_valid_session(self):
-        module = _build_module()
-        client = _build_client(module)
-
+    def test_csrf_returns_token_for_valid_session(self, client):
         cookie = _make_session_cookie()
         client.cookies.set(COOKIE_NAME, cookie)
 
@@ -405,17 +394,11 @@ class TestCsrf:
         assert resp.headers["cache-control"] == "no-store"
         assert "cookie" in resp.headers.get("vary", "").lower()
 
-    def test_csrf_requires_session(self):
-        module = _build_module()
-        client = _build_client(module)
-
+    def test_csrf_requires_session(self, client):
         resp = client.get("/api/auth/csrf")
         assert resp.status_code == 401
 
-    def test_csrf_rejects_expired_session(self):
-        module = _build_module()
-        client = _build_client(module)
-
+    def test_csrf_rejects_expired_session(self, client):
         cookie = _make_session_cookie(expires_delta=-60)
         client.cookies.set(COOKIE_NAME, cookie)
 
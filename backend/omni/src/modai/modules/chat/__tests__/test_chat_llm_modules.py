@@ -29,7 +29,6 @@ from unittest.mock import AsyncMock, Mock
 import httpx as httpx_lib
 import openai
 import pytest
-from dotenv import find_dotenv, load_dotenv
 from fastapi import Request
 from testcontainers.core.container import DockerContainer
 
@@ -44,8 +43,6 @@ from modai.modules.model_provider.module import (
 # Use __file__ so paths resolve correctly regardless of the working directory
 # (e.g. when tests are launched from the project root by VS Code).
 _TEST_FILE = Path(__file__).resolve()
-_BACKEND_ROOT = _TEST_FILE.parents[5]  # backend/omni/
-load_dotenv(find_dotenv(str(_BACKEND_ROOT / ".env")))
 
 # ---------------------------------------------------------------------------
 # AIMock container config
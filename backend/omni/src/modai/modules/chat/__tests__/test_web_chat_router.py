@@ -1,15 +1,30 @@
-from pathlib import Path
-from dotenv import find_dotenv, load_dotenv
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 from modai.module import ModuleDependencies
 from modai.modules.chat.web_chat_router import ChatWebModule
 from modai.modules.chat.module import ChatLLMModule
-from modai.modules.session.module import SessionModule, Session
+from modai.modules.session.dev_mock_session import DevMockSessionModule
+from modai.modules.session.__tests__.rejecting_session_module import (
+    RejectingSessionModule,
+)
 import openai
 
 
+_HELLO_DELTA_JSON = '{"type": "response.output_text.delta", "delta": "Hello", "response_id": "test_response"}'
+
+# Streaming event the dummy LLM yields; the router only serializes it
+_HELLO_DELTA_EVENT = SimpleNamespace(
+    type="response.output_text.delta",
+    delta="Hello",
+    response_id="test_response",
+    model_dump_json=lambda: _HELLO_DELTA_JSON,
+)
+
+
 class MockBody(dict):
     def __init__(self, model, stream=False):
         super().__init__()
@@ -27,12 +42,7 @@ class DummyLLMModule(ChatLLMModule):
         if body_json.get("stream", False):
             # Return a simple async generator
             async def gen():
-                event = Mock()
-                event.type = "response.output_text.delta"
-                event.delta = "Hello"
-                event.response_id = "test_response"
-                event.model_dump_json.return_value = '{"type": "response.output_text.delta", "delta": "Hello", "response_id": "test_response"}'
-                yield event
+                yield _HELLO_DELTA_EVENT
 
             return gen()
         else:
@@ -43,24 +53,18 @@ class DummyLLMModule(ChatLLMModule):
             return response
 
 
-working_dir = Path.cwd()
-load_dotenv(find_dotenv(str(working_dir / ".env")))
-
-
 def _create_chat_mock_session_module():
-    """Create a mock session module that validates successfully."""
-    session_module = MagicMock(spec=SessionModule)
-    session_module.validate_session.return_value = Session(
-        user_id="test-user", additional={}
-    )
-    return session_module
+    """Create a session module that validates successfully."""
+    return DevMockSessionModule(ModuleDependencies(), {"user_id": "test-user"})
 
 
-@pytest.mark.asyncio
-async def test_chat_web_module_routing():
-    """Test ChatWebModule routing to dummy LLM module."""
-    from fastapi import Request
+def _request() -> Request:
+    return Request({"type": "http", "method": "POST", "path": "/api/responses"})
+
 
+@pytest.fixture(scope="module")
+def web_module() -> ChatWebModule:
+    """ChatWebModule routing the "dummy" client to a DummyLLMModule."""
     # Create dummy module
     dummy_module = DummyLLMModule(
         dependencies=ModuleDependencies(),
@@ -75,13 +79,16 @@ async def test_chat_web_module_routing():
     mock_dependencies.modules = {"session": session_module}
 
     # Create ChatWebModule
-    web_module = ChatWebModule(
+    return ChatWebModule(
         dependencies=mock_dependencies,
         config={"clients": {"dummy": "dummy_module"}},
     )
 
-    # Mock request
-    request = Mock(spec=Request)
+
+@pytest.mark.asyncio
+async def test_chat_web_module_routing(web_module: ChatWebModule):
+    """Test ChatWebModule routing to dummy LLM module."""
+    request = _request()
 
     # Test non-streaming
     body_json = MockBody(model="dummy/test_model", stream=False)
@@ -99,31 +106,9 @@ async def test_chat_web_module_routing():
 
 
 @pytest.mark.asyncio
-async def test_chat_web_module_routing_streaming():
+async def test_chat_web_module_routing_streaming(web_module: ChatWebModule):
     """Test ChatWebModule routing for streaming."""
-    from fastapi import Request
-
-    # Create dummy module
-    dummy_module = DummyLLMModule(
-        dependencies=ModuleDependencies(),
-        config={},
-    )
-
-    session_module = _create_chat_mock_session_module()
-
-    # Mock dependencies - include session in modules dict
-    mock_dependencies = Mock(spec=ModuleDependencies)
-    mock_dependencies.get_module.return_value = dummy_module
-    mock_dependencies.modules = {"session": session_module}
-
-    # Create ChatWebModule
-    web_module = ChatWebModule(
-        dependencies=mock_dependencies,
-        config={"clients": {"dummy": "dummy_module"}},
-    )
-
-    # Mock request
-    request = Mock(spec=Request)
+    request = _request()
 
     # Test streaming
     body_json = MockBody(model="dummy/test_model", stream=True)
@@ -131,15 +116,11 @@ async def test_chat_web_module_routing_streaming():
     result = await web_module.responses_endpoint(request, body_json)
 
     # Assertions
-    from fastapi.responses import StreamingResponse
-
     assert isinstance(result, StreamingResponse)
     assert result.media_type == "text/event-stream"
 
     # Collect content from stream
-    content = ""
-    async for chunk in result.body_iterator:
-        content += chunk
+    content = "".join([chunk async for chunk in result.body_iterator])
 
     # Should contain the SSE formatted event
     assert "data:" in content
@@ -148,17 +129,12 @@ async def test_chat_web_module_routing_streaming():
 
 def test_responses_endpoint_rejects_unauthenticated_request():
     """The POST /responses endpoint must return 401 without a valid session."""
-    from fastapi import FastAPI, HTTPException
-
     dummy_module = DummyLLMModule(
         dependencies=ModuleDependencies(),
         config={},
     )
 
-    rejecting_session = MagicMock(spec=SessionModule)
-    rejecting_session.validate_session.side_effect = HTTPException(
-        status_code=401, detail="Missing, invalid or expired session"
-    )
+    rejecting_session = RejectingSessionModule(ModuleDependencies(), {})
 
     mock_dependencies = Mock(spec=ModuleDependencies)
     mock_dependencies.get_module.return_value = dummy_module
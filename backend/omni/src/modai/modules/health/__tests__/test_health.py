@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
@@ -6,13 +8,14 @@ from modai.modules.health.simple_health_module import SimpleHealthModule
 from modai.module import ModuleDependencies
 
 
-@pytest.fixture
-def client():
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
     app = FastAPI()
     dependencies = ModuleDependencies()
     module = SimpleHealthModule(dependencies, config={})
     app.include_router(module.router)
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
 def test_health_endpoint_returns_healthy_status(client):
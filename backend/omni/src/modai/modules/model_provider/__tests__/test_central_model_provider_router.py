@@ -3,7 +3,6 @@ Tests for Central Model Provider Router.
 """
 
 import pytest
-from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 
@@ -14,7 +13,10 @@ from modai.modules.model_provider.module import (
     ModelProvidersListResponse,
     ModelResponse,
 )
-from modai.modules.session.module import SessionModule, Session
+from modai.modules.session.dev_mock_session import DevMockSessionModule
+from modai.modules.session.__tests__.rejecting_session_module import (
+    RejectingSessionModule,
+)
 from modai.module import ModuleDependencies
 
 
@@ -63,8 +65,9 @@ class DummyModelProviderModule(ModelProviderModule):
 class TestCentralModelProviderRouter:
     """Test class for Central Model Provider Router"""
 
-    @pytest.fixture
-    def mock_provider_modules(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_provider_modules(cls):
         """Create mock provider modules"""
         # Create dummy OpenAI provider module
         openai_provider = ModelProviderResponse(
@@ -130,17 +133,15 @@ class TestCentralModelProviderRouter:
 
         return [openai_module, ollama_module]
 
-    @pytest.fixture
-    def mock_session_module(self):
-        """Create a mock session module that always validates successfully."""
-        session_module = MagicMock(spec=SessionModule)
-        session_module.validate_session.return_value = Session(
-            user_id="test-user", additional={}
-        )
-        return session_module
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_session_module(cls):
+        """Create a session module that always validates successfully."""
+        return DevMockSessionModule(ModuleDependencies(), {"user_id": "test-user"})
 
-    @pytest.fixture
-    def central_router(self, mock_provider_modules, mock_session_module):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def central_router(cls, mock_provider_modules, mock_session_module):
         """Create central router instance"""
         dependencies = ModuleDependencies(
             {
@@ -152,12 +153,14 @@ class TestCentralModelProviderRouter:
         config = {}
         return CentralModelProviderRouter(dependencies, config)
 
-    @pytest.fixture
-    def test_client(self, central_router):
-        """Create FastAPI test client"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def test_client(cls, central_router):
+        """Create FastAPI test client shared by all tests in the class"""
         app = FastAPI()
         app.include_router(central_router.router)
-        return TestClient(app)
+        with TestClient(app) as client:
+            yield client
 
     def test_get_all_providers_endpoint(self, test_client):
         """Test GET /models/providers endpoint"""
@@ -260,50 +263,39 @@ class TestCentralModelProviderRouter:
         assert data["limit"] == 1
         assert data["offset"] == 0
 
-    def test_get_all_providers_empty(self, mock_session_module):
-        """Test GET /models/providers with no provider modules"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def empty_client(cls, mock_session_module):
+        """Create a test client for a router without any provider modules"""
         dependencies = ModuleDependencies({"session": mock_session_module})
-        config = {}
-        router = CentralModelProviderRouter(dependencies, config)
-
-        app = FastAPI()
-        app.include_router(router.router)
-        client = TestClient(app)
-
-        response = client.get("/api/models/providers")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["providers"] == []
-        assert data["total"] == 0
-
-    def test_get_all_models_empty(self, mock_session_module):
-        """Test GET /models with no provider modules"""
-        dependencies = ModuleDependencies({"session": mock_session_module})
-        config = {}
-        router = CentralModelProviderRouter(dependencies, config)
+        router = CentralModelProviderRouter(dependencies, config={})
 
         app = FastAPI()
         app.include_router(router.router)
-        client = TestClient(app)
-
-        response = client.get("/api/models")
+        with TestClient(app) as client:
+            yield client
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            (
+                "/api/models/providers",
+                {"providers": [], "total": 0, "limit": None, "offset": None},
+            ),
+            ("/api/models", {"object": "list", "data": []}),
+        ],
+        ids=["providers", "models"],
+    )
+    def test_endpoints_with_no_provider_modules(self, empty_client, path, expected):
+        """Test GET /models/providers and GET /models with no provider modules"""
+        response = empty_client.get(path)
 
         assert response.status_code == 200
-        data = response.json()
-
-        assert data["object"] == "list"
-        assert data["data"] == []
+        assert response.json() == expected
 
     def test_all_endpoints_reject_unauthenticated_requests(self):
         """All central model provider endpoints must return 401 without a valid session."""
-        from fastapi import HTTPException
-
-        rejecting_session = MagicMock(spec=SessionModule)
-        rejecting_session.validate_session.side_effect = HTTPException(
-            status_code=401, detail="Missing, invalid or expired session"
-        )
+        rejecting_session = RejectingSessionModule(ModuleDependencies(), {})
 
         dependencies = ModuleDependencies({"session": rejecting_session})
         router = CentralModelProviderRouter(dependencies, config={})
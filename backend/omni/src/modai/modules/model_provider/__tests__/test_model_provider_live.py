@@ -0,0 +1,79 @@
+"""
+Live tests for the OpenAI provider REST API against a real OpenAI-compatible API.
+
+Deselected by default; run with `just test-live` and UNIT_TEST_OPENAI_API_KEY set.
+"""
+
+import os
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from modai.module import ModuleDependencies
+from modai.modules.model_provider.openai_provider import OpenAIProviderModule
+from modai.modules.model_provider_store.inmemory_model_provider_store import (
+    InMemoryModelProviderStore,
+)
+from modai.modules.session.dev_mock_session import DevMockSessionModule
+
+PROVIDERS_PATH = "/api/models/providers/openai"
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+pytestmark = [
+    pytest.mark.live,
+    pytest.mark.skipif(
+        "UNIT_TEST_OPENAI_API_KEY" not in os.environ,
+        reason="UNIT_TEST_OPENAI_API_KEY not set",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def test_client() -> Iterator[TestClient]:
+    """Create a test client backed by an in-memory provider store"""
+    dependencies = ModuleDependencies(
+        {
+            "llm_provider_store": InMemoryModelProviderStore(ModuleDependencies(), {}),
+            "session": DevMockSessionModule(
+                ModuleDependencies(), {"user_id": "test-user"}
+            ),
+        }
+    )
+    module = OpenAIProviderModule(
+        dependencies, {"llm_provider_store_module": "llm_provider_store"}
+    )
+    app = FastAPI()
+    app.include_router(module.router)
+    with TestClient(app) as client:
+        yield client
+
+
+def test_get_models_endpoint(test_client: TestClient) -> None:
+    """Test GET /models/providers/openai/{provider_id}/models endpoint"""
+    created = test_client.post(
+        PROVIDERS_PATH,
+        json={
+            "name": "OpenAI",
+            "base_url": OPENAI_BASE_URL,
+            "api_key": os.environ["UNIT_TEST_OPENAI_API_KEY"],
+        },
+    )
+    assert created.status_code == 201
+
+    response = test_client.get(f"{PROVIDERS_PATH}/{created.json()['id']}/models")
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["object"] == "list"
+    assert isinstance(data["data"], list)
+    assert len(data["data"]) >= 1
+
+    # Check model structure (OpenAI-compatible)
+    model = data["data"][0]
+    assert "id" in model
+    assert "created" in model
+    assert "owned_by" in model
+    assert model["object"] == "model"
@@ -99,6 +99,56 @@ class AbstractModelProviderStoreTestBase(ABC):
         assert retrieved_provider.url == "https://api.openai.com/v1"
         assert retrieved_provider.properties["temperature"] == 0.7
 
+    @pytest.mark.anyio
+    async def test_get_provider_by_name_returns_correct_provider(
+        self, model_provider_store: ModelProviderStore
+    ):
+        """Test that get_provider_by_name returns the provider with that name"""
+        await model_provider_store.add_provider(
+            name="OpenAI", url="https://api.openai.com/v1", properties={}
+        )
+        provider_b = await model_provider_store.add_provider(
+            name="Anthropic", url="https://api.anthropic.com/v1", properties={}
+        )
+
+        retrieved_provider = await model_provider_store.get_provider_by_name(
+            "Anthropic"
+        )
+
+        assert retrieved_provider is not None
+        assert retrieved_provider.id == provider_b.id
+        assert retrieved_provider.url == "https://api.anthropic.com/v1"
+
+    @pytest.mark.anyio
+    async def test_get_provider_by_name_with_nonexistent_name_returns_none(
+        self, model_provider_store
+    ):
+        """Test that getting a provider with non-existent name returns None"""
+        result = await model_provider_store.get_provider_by_name("nonexistent")
+        assert result is None
+
+    @pytest.mark.anyio
+    async def test_get_provider_by_name_follows_renames_and_deletes(
+        self, model_provider_store
+    ):
+        """Test that the name lookup reflects updates and deletions"""
+        provider = await model_provider_store.add_provider(
+            name="OldName", url="https://api.old.com", properties={}
+        )
+
+        await model_provider_store.update_provider(
+            provider.id, name="NewName", url="https://api.old.com", properties={}
+        )
+
+        assert await model_provider_store.get_provider_by_name("OldName") is None
+        renamed = await model_provider_store.get_provider_by_name("NewName")
+        assert renamed is not None
+        assert renamed.id == provider.id
+
+        await model_provider_store.delete_provider(provider.id)
+
+        assert await model_provider_store.get_provider_by_name("NewName") is None
+
     @pytest.mark.anyio
     async def test_update_provider_updates_all_fields(
         self, model_provider_store: ModelProviderStore
@@ -265,6 +315,44 @@ class AbstractModelProviderStoreTestBase(ABC):
         assert provider.properties["features"]["streaming"] is True
         assert provider.properties["metadata"]["region"] == "us-east-1"
 
+    @pytest.mark.anyio
+    async def test_add_provider_rejects_non_json_serializable_properties(
+        self, model_provider_store
+    ):
+        """Test that adding a provider with non-JSON serializable properties raises ValueError"""
+
+        class BadObject:
+            def __str__(self):
+                raise RuntimeError("Cannot convert to string")
+
+            def __repr__(self):
+                raise RuntimeError("Cannot convert to repr")
+
+        with pytest.raises(ValueError):
+            await model_provider_store.add_provider(
+                name="BadProps",
+                url="https://api.test.com",
+                properties={"bad_object": BadObject()},
+            )
+
+    @pytest.mark.anyio
+    async def test_stored_provider_is_not_affected_by_caller_mutations(
+        self, model_provider_store
+    ):
+        """Test that mutating passed-in or returned properties does not change stored data"""
+        properties = {"models": ["gpt-4"]}
+        created = await model_provider_store.add_provider(
+            name="Isolated", url="https://api.isolated.com", properties=properties
+        )
+
+        properties["models"].append("injected")
+        created.properties["models"].append("injected-via-result")
+        fetched = await model_provider_store.get_provider(created.id)
+        fetched.properties["extra"] = True
+
+        retrieved = await model_provider_store.get_provider(created.id)
+        assert retrieved.properties == {"models": ["gpt-4"]}
+
     @pytest.mark.anyio
     async def test_get_providers_without_pagination_returns_all(
         self, model_provider_store
@@ -314,13 +402,54 @@ class AbstractModelProviderStoreTestBase(ABC):
         page3 = await model_provider_store.get_providers(limit=3, offset=6)
 
         # Collect all paginated IDs
-        all_paginated_ids = set()
-        for provider in page1 + page2 + page3:
-            all_paginated_ids.add(provider.id)
+        pages = (page1, page2, page3)
+        all_paginated_ids = set().union(*({p.id for p in page} for page in pages))
 
         # Ensure no overlap and all providers are covered
         assert all_paginated_ids == all_provider_ids
-        assert len(all_paginated_ids) == 7
+        assert sum(len(page) for page in pages) == len(all_paginated_ids) == 7
+
+    @pytest.mark.anyio
+    async def test_iter_providers_yields_same_providers_as_get_providers(
+        self, model_provider_store
+    ):
+        """Test that iter_providers streams the same providers, in order, as get_providers"""
+        for i in range(5):
+            await model_provider_store.add_provider(
+                name=f"Provider{i}", url=f"https://api{i}.com", properties={}
+            )
+
+        listed_ids = [p.id for p in await model_provider_store.get_providers()]
+        streamed_ids = [p.id async for p in model_provider_store.iter_providers()]
+
+        assert streamed_ids == listed_ids
+
+    @pytest.mark.anyio
+    async def test_iter_providers_pagination_covers_all_providers_without_overlap(
+        self, model_provider_store
+    ):
+        """Test that paginated iteration covers all providers without overlap or duplication"""
+        for i in range(7):
+            await model_provider_store.add_provider(
+                name=f"Provider{i:02d}",
+                url=f"https://api{i}.com",
+                properties={"large_text": "Lorem ipsum " * 100},
+            )
+
+        # Only IDs are kept, so large properties are never held for all providers at once
+        all_provider_ids = set()
+        async for provider in model_provider_store.iter_providers():
+            all_provider_ids.add(provider.id)
+
+        paginated_ids = []
+        for offset in (0, 3, 6):
+            async for provider in model_provider_store.iter_providers(
+                limit=3, offset=offset
+            ):
+                paginated_ids.append(provider.id)
+
+        assert len(paginated_ids) == 7
+        assert set(paginated_ids) == all_provider_ids
 
     @pytest.mark.anyio
     async def test_add_provider_trims_whitespace_from_name_and_url(
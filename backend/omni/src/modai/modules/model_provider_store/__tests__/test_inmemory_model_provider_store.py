@@ -0,0 +1,33 @@
+import pytest
+
+from modai.module import ModuleDependencies
+from modai.modules.model_provider_store.inmemory_model_provider_store import (
+    InMemoryModelProviderStore,
+)
+from modai.modules.model_provider_store.__tests__.abstract_model_provider_store_test import (
+    AbstractModelProviderStoreTestBase,
+)
+
+
+class TestInMemoryModelProviderStore(AbstractModelProviderStoreTestBase):
+    """Test class for InMemoryModelProviderStore using the abstract test base"""
+
+    def create_model_provider_store(self):
+        """Create and return an InMemoryModelProviderStore instance for testing"""
+        return InMemoryModelProviderStore(ModuleDependencies(), {})
+
+    @pytest.mark.anyio
+    async def test_reset_removes_all_providers(self):
+        """Test that reset leaves the store empty and reusable"""
+        provider_store = self.create_model_provider_store()
+        await provider_store.add_provider(
+            name="ToReset", url="https://api.reset.com", properties={}
+        )
+
+        provider_store.reset()
+
+        assert await provider_store.get_providers() == []
+        provider = await provider_store.add_provider(
+            name="ToReset", url="https://api.reset.com", properties={}
+        )
+        assert provider.name == "ToReset"
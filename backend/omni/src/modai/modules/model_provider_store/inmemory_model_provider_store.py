@@ -0,0 +1,155 @@
+"""
+In-memory ModelProviderStore implementation for testing and development usage.
+This implementation stores all data in memory and will be lost when the application restarts.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any, List
+from dataclasses import replace
+from datetime import datetime
+from itertools import islice
+import copy
+import json
+import uuid
+
+from modai.module import ModuleDependencies
+from modai.modules.model_provider_store.module import ModelProviderStore, ModelProvider
+from modai.modules.reset.resettable import Resettable
+
+
+class InMemoryModelProviderStore(ModelProviderStore, Resettable):
+    """
+    In-memory implementation of the ModelProviderStore module.
+
+    Providers are kept in a dictionary keyed by ID, with a secondary
+    name -> ID index so that name lookups and uniqueness checks do not
+    need to scan all providers.
+
+    Properties are deep-copied on the way in and out, so callers cannot
+    mutate stored state through a dict or provider they hold on to.
+
+    Suitable for development, testing, and prototyping.
+    """
+
+    def __init__(self, dependencies: ModuleDependencies, config: dict[str, Any]):
+        super().__init__(dependencies, config)
+
+        # In-memory storage
+        self._providers: dict[str, ModelProvider] = {}  # provider_id -> ModelProvider
+        self._by_name: dict[str, str] = {}  # provider name -> provider_id
+
+    def _generate_provider_id(self) -> str:
+        """Generate a unique provider ID"""
+        return str(uuid.uuid4())
+
+    def _validate_properties(self, properties: dict[str, Any]) -> None:
+        """Validate that properties can be JSON serialized"""
+        try:
+            json.dumps(properties)
+        except (TypeError, ValueError, RuntimeError) as e:
+            raise ValueError(f"Properties must be JSON serializable: {e}")
+
+    def _copy_provider(self, provider: ModelProvider) -> ModelProvider:
+        """Return a copy of a stored provider that shares no mutable state"""
+        return replace(provider, properties=copy.deepcopy(provider.properties))
+
+    async def get_providers(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> List[ModelProvider]:
+        return [provider async for provider in self.iter_providers(limit, offset)]
+
+    async def iter_providers(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> AsyncIterator[ModelProvider]:
+        # Snapshot references only, so writes during iteration are safe;
+        # the (potentially large) property copies are made lazily per item
+        start = offset or 0
+        end = start + limit if limit else None
+
+        for provider in islice(list(self._providers.values()), start, end):
+            yield self._copy_provider(provider)
+
+    async def get_provider(self, provider_id: str) -> ModelProvider | None:
+        provider = self._providers.get(provider_id)
+        return self._copy_provider(provider) if provider else None
+
+    async def get_provider_by_name(self, name: str) -> ModelProvider | None:
+        provider_id = self._by_name.get(name.strip())
+        return await self.get_provider(provider_id) if provider_id else None
+
+    async def add_provider(
+        self, name: str, url: str, properties: dict[str, Any], enabled: bool = False
+    ) -> ModelProvider:
+        name = name.strip()
+        if name in self._by_name:
+            raise ValueError(f"Provider name '{name}' already exists")
+        if properties is None:
+            properties = {}
+        self._validate_properties(properties)
+
+        now = datetime.now()
+        provider = ModelProvider(
+            id=self._generate_provider_id(),
+            name=name,
+            url=url.strip(),
+            properties=copy.deepcopy(properties),
+            enabled=enabled,
+            created_at=now,
+            updated_at=now,
+        )
+
+        self._providers[provider.id] = provider
+        self._by_name[name] = provider.id
+
+        return self._copy_provider(provider)
+
+    async def update_provider(
+        self,
+        provider_id: str,
+        name: str,
+        url: str,
+        properties: dict[str, Any],
+        enabled: bool | None = None,
+    ) -> ModelProvider | None:
+        existing = self._providers.get(provider_id)
+        if existing is None:
+            return None
+
+        name = name.strip()
+        if self._by_name.get(name, provider_id) != provider_id:
+            raise ValueError(f"Provider name '{name}' already exists")
+        if properties is None:
+            properties = {}
+        self._validate_properties(properties)
+
+        provider = ModelProvider(
+            id=provider_id,
+            name=name,
+            url=url.strip(),
+            properties=copy.deepcopy(properties),
+            enabled=enabled if enabled is not None else existing.enabled,
+            created_at=existing.created_at,
+            updated_at=datetime.now(),
+        )
+
+        del self._by_name[existing.name]
+        self._by_name[name] = provider_id
+        self._providers[provider_id] = provider
+
+        return self._copy_provider(provider)
+
+    async def delete_provider(self, provider_id: str) -> None:
+        # Idempotent operation - no error if provider doesn't exist
+        provider = self._providers.pop(provider_id, None)
+        if provider is not None:
+            del self._by_name[provider.name]
+
+    # Resettable implementation
+    def reset(self) -> None:
+        """Remove all providers from memory."""
+        self._providers = {}
+        self._by_name = {}
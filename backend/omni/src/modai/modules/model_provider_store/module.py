@@ -7,6 +7,7 @@ Model Provider Store Module: Provides model provider configuration management.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from collections.abc import AsyncIterator
 from typing import Any, List
 from datetime import datetime
 
@@ -53,6 +54,30 @@ class ModelProviderStore(ModaiModule, ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_providers(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> AsyncIterator[ModelProvider]:
+        """
+        Iterates over model providers one at a time, in the same order and with
+        the same pagination semantics as get_providers().
+
+        Unlike get_providers(), implementations must not materialize the whole
+        result set up front, so memory use stays bounded for large stores.
+        Implementations may hold a database connection while iterating, so
+        callers must either exhaust the iterator or close it with aclose().
+
+        Args:
+            limit: Maximum number of providers to yield
+            offset: Number of providers to skip
+
+        Returns:
+            Async iterator of ModelProvider objects
+        """
+        pass
+
     @abstractmethod
     async def get_provider(self, provider_id: str) -> ModelProvider | None:
         """
@@ -66,6 +91,23 @@ class ModelProviderStore(ModaiModule, ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_provider_by_name(self, name: str) -> ModelProvider | None:
+        """
+        Retrieves a specific model provider by its unique name.
+
+        Implementations must back provider names with a unique index so that
+        this lookup (and the duplicate-name check on add/update) does not
+        require scanning all providers.
+
+        Args:
+            name: Name of the provider (surrounding whitespace is ignored)
+
+        Returns:
+            ModelProvider object if found, None otherwise
+        """
+        pass
+
     @abstractmethod
     async def add_provider(
         self, name: str, url: str, properties: dict[str, Any], enabled: bool = False
@@ -3,6 +3,7 @@ SQLAlchemy-based ModelProviderStore implementation for production usage.
 This implementation uses pure SQLAlchemy for database persistence with isolated metadata.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any, List
 from datetime import datetime
 import uuid
@@ -17,6 +18,7 @@ from sqlalchemy import (
     String,
     JSON,
     DateTime,
+    Select,
     select,
     update,
     delete,
@@ -27,6 +29,9 @@ from modai.module import ModuleDependencies, PersistenceModule
 from modai.modules.model_provider_store.module import ModelProviderStore, ModelProvider
 from modai.modules.reset.resettable import Resettable
 
+# Number of rows fetched per round trip when streaming providers
+_ITER_BATCH_SIZE = 100
+
 
 class SQLAlchemyModelProviderStore(ModelProviderStore, PersistenceModule, Resettable):
     """
@@ -94,6 +99,19 @@ class SQLAlchemyModelProviderStore(ModelProviderStore, PersistenceModule, Resett
             updated_at=row.updated_at,
         )
 
+    def _select_providers(self, limit: int | None, offset: int | None) -> Select:
+        """Build the ordered, paginated SELECT shared by get/iter_providers"""
+        statement = select(self.model_providers_table).order_by(
+            self.model_providers_table.c.created_at
+        )
+
+        if offset:
+            statement = statement.offset(offset)
+        if limit:
+            statement = statement.limit(limit)
+
+        return statement
+
     def _generate_provider_id(self) -> str:
         """Generate a unique provider ID"""
         return str(uuid.uuid4())
@@ -111,19 +129,26 @@ class SQLAlchemyModelProviderStore(ModelProviderStore, PersistenceModule, Resett
         offset: int | None = None,
     ) -> List[ModelProvider]:
         with self._get_session() as session:
-            statement = select(self.model_providers_table).order_by(
-                self.model_providers_table.c.created_at
-            )
-
-            if offset:
-                statement = statement.offset(offset)
-            if limit:
-                statement = statement.limit(limit)
-
-            result = session.execute(statement)
+            result = session.execute(self._select_providers(limit, offset))
             rows = result.fetchall()
             return [self._row_to_provider(row) for row in rows]
 
+    async def iter_providers(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> AsyncIterator[ModelProvider]:
+        with self._get_session() as session:
+            statement = self._select_providers(limit, offset).execution_options(
+                yield_per=_ITER_BATCH_SIZE
+            )
+            result = session.execute(statement)
+            try:
+                for row in result:
+                    yield self._row_to_provider(row)
+            finally:
+                result.close()
+
     async def get_provider(self, provider_id: str) -> ModelProvider | None:
         with self._get_session() as session:
             statement = select(self.model_providers_table).where(
@@ -135,6 +160,16 @@ class SQLAlchemyModelProviderStore(ModelProviderStore, PersistenceModule, Resett
                 return self._row_to_provider(row)
             return None
 
+    async def get_provider_by_name(self, name: str) -> ModelProvider | None:
+        with self._get_session() as session:
+            statement = select(self.model_providers_table).where(
+                self.model_providers_table.c.name == name.strip()
+            )
+            row = session.execute(statement).fetchone()
+            if row:
+                return self._row_to_provider(row)
+            return None
+
     async def add_provider(
         self, name: str, url: str, properties: dict[str, Any], enabled: bool = False
     ) -> ModelProvider:
@@ -143,6 +178,7 @@ class SQLAlchemyModelProviderStore(ModelProviderStore, PersistenceModule, Resett
             # Validate and prepare properties
             if properties is None:
                 properties = {}
+            self._validate_properties(properties)
 
             now = datetime.now()
 
@@ -191,6 +227,7 @@ class SQLAlchemyModelProviderStore(ModelProviderStore, PersistenceModule, Resett
 
             if properties is None:
                 properties = {}
+            self._validate_properties(properties)
 
             now = datetime.now()
             new_enabled = enabled if enabled is not None else bool(existing_row.enabled)
@@ -0,0 +1,16 @@
+"""
+Session module stub shared by router tests that exercise the unauthenticated path.
+"""
+
+from fastapi import HTTPException, Request
+
+from modai.modules.session.module import Session, SessionModule
+
+
+class RejectingSessionModule(SessionModule):
+    """Session module that rejects every request as unauthenticated."""
+
+    def validate_session(self, request: Request) -> Session:
+        raise HTTPException(
+            status_code=401, detail="Missing, invalid or expired session"
+        )
@@ -2,7 +2,7 @@ import time
 
 import jwt
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 from unittest.mock import Mock
 
@@ -55,6 +55,18 @@ def _make_cookie(
     )
 
 
+@pytest.fixture(scope="module")
+def session_module() -> OIDCSessionModule:
+    """Session module shared by the tests that don't vary its config."""
+    return _build_module()
+
+
+@pytest.fixture(scope="module")
+def valid_cookie() -> str:
+    """Valid session cookie, signed once for the whole module."""
+    return _make_cookie()
+
+
 # ── Construction ─────────────────────────────────────────────────────────────
 
 
@@ -72,65 +84,55 @@ class TestConstruction:
 
 
 class TestValidateSession:
-    def test_valid_cookie_returns_session(self):
-        module = _build_module()
+    def test_valid_cookie_returns_session(
+        self, session_module: OIDCSessionModule, valid_cookie: str
+    ):
         request = Mock()
-        request.cookies = {COOKIE_NAME: _make_cookie()}
+        request.cookies = {COOKIE_NAME: valid_cookie}
 
-        session = module.validate_session(request)
+        session = session_module.validate_session(request)
         assert isinstance(session, Session)
         assert session.user_id == "user-1"
         assert session.additional["email"] == "u@test.com"
         assert session.additional["name"] == "Test"
 
-    def test_no_cookie_returns_401(self):
-        from fastapi import HTTPException
-
-        module = _build_module()
+    def test_no_cookie_returns_401(self, session_module: OIDCSessionModule):
         request = Mock()
         request.cookies = {}
 
         with pytest.raises(HTTPException) as exc_info:
-            module.validate_session(request)
+            session_module.validate_session(request)
         assert exc_info.value.status_code == 401
 
-    def test_tampered_cookie_returns_401(self):
-        from fastapi import HTTPException
-
-        module = _build_module()
+    def test_tampered_cookie_returns_401(self, session_module: OIDCSessionModule):
         request = Mock()
         request.cookies = {COOKIE_NAME: "garbage.token.here"}
 
         with pytest.raises(HTTPException) as exc_info:
-            module.validate_session(request)
+            session_module.validate_session(request)
         assert exc_info.value.status_code == 401
 
-    def test_expired_cookie_returns_401(self):
-        from fastapi import HTTPException
-
-        module = _build_module()
+    def test_expired_cookie_returns_401(self, session_module: OIDCSessionModule):
         cookie = _make_cookie(expires_delta=-60)
         request = Mock()
         request.cookies = {COOKIE_NAME: cookie}
 
         with pytest.raises(HTTPException) as exc_info:
-            module.validate_session(request)
+            session_module.validate_session(request)
         assert exc_info.value.status_code == 401
 
-    def test_wrong_secret_returns_401(self):
-        from fastapi import HTTPException
-
-        module = _build_module()
+    def test_wrong_secret_returns_401(self, session_module: OIDCSessionModule):
         cookie = _make_cookie(session_secret="other-secret")
         request = Mock()
         request.cookies = {COOKIE_NAME: cookie}
 
         with pytest.raises(HTTPException) as exc_info:
-            module.validate_session(request)
+            session_module.validate_session(request)
         assert exc_info.value.status_code == 401
 
-    def test_optional_claims_included_when_present(self):
-        module = _build_module()
+    def test_optional_claims_included_when_present(
+        self, session_module: OIDCSessionModule
+    ):
         now = int(time.time())
         cookie = jwt.encode(
             {
@@ -147,7 +149,7 @@ class TestValidateSession:
         request = Mock()
         request.cookies = {COOKIE_NAME: cookie}
 
-        session = module.validate_session(request)
+        session = session_module.validate_session(request)
         assert session.additional["email_verified"] is True
 
 
@@ -155,11 +157,10 @@ class TestValidateSession:
 
 
 class TestSessionStatusEndpoint:
-    def test_authenticated(self):
-        module = _build_module()
-        client = _build_client(module)
+    def test_authenticated(self, session_module: OIDCSessionModule, valid_cookie: str):
+        client = _build_client(session_module)
 
-        client.cookies.set(COOKIE_NAME, _make_cookie())
+        client.cookies.set(COOKIE_NAME, valid_cookie)
 
         resp = client.get("/api/auth/userinfo")
         assert resp.status_code == 200
@@ -168,16 +169,14 @@ class TestSessionStatusEndpoint:
         assert data["additional"]["email"] == "u@test.com"
         assert data["additional"]["name"] == "Test"
 
-    def test_unauthenticated_returns_401(self):
-        module = _build_module()
-        client = _build_client(module)
+    def test_unauthenticated_returns_401(self, session_module: OIDCSessionModule):
+        client = _build_client(session_module)
 
         resp = client.get("/api/auth/userinfo")
         assert resp.status_code == 401
 
-    def test_expired_cookie_returns_401(self):
-        module = _build_module()
-        client = _build_client(module)
+    def test_expired_cookie_returns_401(self, session_module: OIDCSessionModule):
+        client = _build_client(session_module)
 
         client.cookies.set(COOKIE_NAME, _make_cookie(expires_delta=-60))
 
@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -46,7 +47,7 @@ FULL_TOOL = {
 
 def _make_module(
     inner_get_tools: AsyncMock,
-    inner_run_tool: AsyncMock,
+    inner_run_tool: Callable[..., Awaitable[Any]],
     variable_mappings: list[dict[str, str]] | None = None,
 ) -> PredefinedVariablesToolRegistryModule:
     inner = MagicMock(spec=ToolRegistryModule)
@@ -60,6 +61,18 @@ def _make_module(
     return PredefinedVariablesToolRegistryModule(deps, config)
 
 
+def _recording_run_tool(
+    calls: list[tuple[tuple, dict]],
+) -> Callable[..., Awaitable[Any]]:
+    """Inner run_tool stub that records each call's (args, kwargs) into `calls`."""
+
+    async def run_tool(*args, **kwargs):
+        calls.append((args, kwargs))
+        return "ok"
+
+    return run_tool
+
+
 class TestExtractPredefinedParams:
     def test_stores_both_hyphen_and_underscore_forms(self):
         params = _extract_predefined_params(
@@ -125,10 +138,10 @@ class TestRunTool:
     @pytest.mark.asyncio
     async def test_auto_injects_underscore_form_parameter(self):
         """Header X-Session-Id is injected as x_session_id without explicit config."""
-        inner_run_tool = AsyncMock(return_value="ok")
+        calls: list[tuple[tuple, dict]] = []
         module = _make_module(
             inner_get_tools=AsyncMock(return_value=[FULL_TOOL]),
-            inner_run_tool=inner_run_tool,
+            inner_run_tool=_recording_run_tool(calls),
         )
 
         await module.run_tool(
@@ -136,16 +149,16 @@ class TestRunTool:
             {"name": "get_user_order", "arguments": {"user_id": "alice"}},
         )
 
-        call_args = inner_run_tool.call_args[0][1]
+        call_args = calls[-1][0][1]
         assert call_args["arguments"]["x_session_id"] == "sid-1"
 
     @pytest.mark.asyncio
     async def test_auto_injects_header_style_parameter(self):
         """Header X-Session-Id is also injected as X-Session-Id without explicit config."""
-        inner_run_tool = AsyncMock(return_value="ok")
+        calls: list[tuple[tuple, dict]] = []
         module = _make_module(
             inner_get_tools=AsyncMock(return_value=[FULL_TOOL]),
-            inner_run_tool=inner_run_tool,
+            inner_run_tool=_recording_run_tool(calls),
         )
 
         await module.run_tool(
@@ -153,16 +166,16 @@ class TestRunTool:
             {"name": "get_user_order", "arguments": {"user_id": "alice"}},
         )
 
-        call_args = inner_run_tool.call_args[0][1]
+        call_args = calls[-1][0][1]
         assert call_args["arguments"]["X-Session-Id"] == "sid-1"
 
     @pytest.mark.asyncio
     async def test_explicit_mapping_injects_target_parameter(self):
         """Explicit mapping fills the specified tool param alongside auto-matched ones."""
-        inner_run_tool = AsyncMock(return_value="ok")
+        calls: list[tuple[tuple, dict]] = []
         module = _make_module(
             inner_get_tools=AsyncMock(return_value=[FULL_TOOL]),
-            inner_run_tool=inner_run_tool,
+            inner_run_tool=_recording_run_tool(calls),
             variable_mappings=[
                 {"from_modai_header": "X-Session-Id", "to_tool_parameter": "session_id"}
             ],
@@ -173,7 +186,7 @@ class TestRunTool:
             {"name": "get_user_order", "arguments": {"user_id": "alice"}},
         )
 
-        call_args = inner_run_tool.call_args[0][1]
+        call_args = calls[-1][0][1]
         # explicit mapping target is injected
         assert call_args["arguments"]["session_id"] == "sid-1"
         # auto-matched forms are also still injected
@@ -1,7 +1,7 @@
 import pytest
-from unittest.mock import Mock, MagicMock, AsyncMock
+from unittest.mock import Mock, MagicMock
 from fastapi.testclient import TestClient
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from datetime import datetime
 from modai.module import ModuleDependencies
 from modai.modules.user.simple_user_module import SimpleUserModule
@@ -9,7 +9,19 @@ from modai.modules.session.module import SessionModule, Session
 from modai.modules.user_store.module import UserStore, User
 
 
-@pytest.fixture
+class UserLookupStub:
+    """Async stand-in for UserStore.get_user_by_id returning a preset user"""
+
+    def __init__(self):
+        self.user: User | None = None
+        self.calls: list[str] = []
+
+    async def __call__(self, user_id: str) -> User | None:
+        self.calls.append(user_id)
+        return self.user
+
+
+@pytest.fixture(scope="module")
 def client():
     app = FastAPI()
 
@@ -19,7 +31,7 @@ def client():
 
     # Create a mock user store module
     user_store = Mock(spec=UserStore)
-    user_store.get_user_by_id = AsyncMock()  # This is async
+    user_store.get_user_by_id = UserLookupStub()  # This is async
 
     # Create user module
     user_module = SimpleUserModule(
@@ -29,7 +41,16 @@ def client():
         config={},
     )
     app.include_router(user_module.router)
-    return TestClient(app), user_module, session_module, user_store
+    with TestClient(app) as test_client:
+        yield test_client, user_module, session_module, user_store
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(client):
+    """Clear calls and configured behaviour left on the shared mocks by earlier tests"""
+    _, _, session_module, user_store = client
+    session_module.validate_session.reset_mock(return_value=True, side_effect=True)
+    user_store.get_user_by_id = UserLookupStub()
 
 
 class TestSimpleUserModule:
@@ -80,13 +101,13 @@ def test_get_current_user_success(client):
         id="user123",
         email="test@example.com",
         full_name="Test User",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
     )
 
     # Configure mocks
     session_module.validate_session.return_value = test_session
-    user_store.get_user_by_id.return_value = test_user
+    user_store.get_user_by_id.user = test_user
 
     # Call the endpoint
     response = test_client.get("/api/user")
@@ -99,49 +120,44 @@ def test_get_current_user_success(client):
 
     # Verify calls
     session_module.validate_session.assert_called_once()
-    user_store.get_user_by_id.assert_called_once_with("user123")
-
-
-def test_get_current_user_user_not_found(client):
-    """Test behavior when user is not found in user store"""
-    test_client, user_module, session_module, user_store = client
-
-    # Setup test data
-    test_session = Session(user_id="user123", additional={})
-
-    # Configure mocks
-    session_module.validate_session.return_value = test_session
-    user_store.get_user_by_id.return_value = None  # User not found
-
-    # Call the endpoint
-    response = test_client.get("/api/user")
-
-    assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
-
-    # Verify calls
-    session_module.validate_session.assert_called_once()
-    user_store.get_user_by_id.assert_called_once_with("user123")
-
-
-def test_get_current_user_invalid_session(client):
-    """Test behavior when session validation fails"""
+    assert user_store.get_user_by_id.calls == ["user123"]
+
+
+@pytest.mark.parametrize(
+    "session_error,expected_status,expected_detail,expected_lookups",
+    [
+        (None, 404, "User not found", ["user123"]),
+        (
+            HTTPException(
+                status_code=401, detail="Missing, invalid or expired session"
+            ),
+            401,
+            "Missing, invalid or expired session",
+            # User store should not be called since session validation failed
+            [],
+        ),
+    ],
+    ids=["user-not-found", "invalid-session"],
+)
+def test_get_current_user_error(
+    client, session_error, expected_status, expected_detail, expected_lookups
+):
+    """Test error responses when the session is invalid or the user is unknown"""
     test_client, user_module, session_module, user_store = client
 
-    # Configure mocks to raise HTTPException for invalid session
-    from fastapi import HTTPException
-
-    session_module.validate_session.side_effect = HTTPException(
-        status_code=401, detail="Missing, invalid or expired session"
+    # Configure mocks: the session resolves to user123 unless validation fails,
+    # and the user store never finds the user (its stub returns None by default)
+    session_module.validate_session.return_value = Session(
+        user_id="user123", additional={}
     )
+    session_module.validate_session.side_effect = session_error
 
     # Call the endpoint
     response = test_client.get("/api/user")
 
-    assert response.status_code == 401
-    assert response.json()["detail"] == "Missing, invalid or expired session"
+    assert response.status_code == expected_status
+    assert response.json()["detail"] == expected_detail
 
-    # Verify session validation was called
+    # Verify calls
     session_module.validate_session.assert_called_once()
-    # User store should not be called since session validation failed
-    user_store.get_user_by_id.assert_not_called()
+    assert user_store.get_user_by_id.calls == expected_lookups
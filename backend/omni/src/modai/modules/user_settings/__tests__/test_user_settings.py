@@ -4,7 +4,6 @@ Tests both the abstract module interface and the simple implementation.
 """
 
 import pytest
-from unittest.mock import MagicMock
 from fastapi import HTTPException, Request
 from typing import Any
 
@@ -45,19 +44,22 @@ class MockSessionModule(SessionModule):
 class TestSimpleUserSettingsModule:
     """Test the simple UserSettings module implementation"""
 
-    @pytest.fixture
-    def mock_session_module(self):
-        """Create a mock session module"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_session_module(cls):
+        """Create a mock session module shared by all tests in the class"""
         return MockSessionModule(ModuleDependencies(modules={}), {})
 
-    @pytest.fixture
-    def mock_user_settings_store(self):
-        """Create a mock user settings store"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_user_settings_store(cls):
+        """Create a user settings store shared by all tests in the class"""
         return InMemoryUserSettingsStore(ModuleDependencies(modules={}), {})
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    @classmethod
     def dependencies(
-        self, mock_session_module: UserSettingsModule, mock_user_settings_store
+        cls, mock_session_module: UserSettingsModule, mock_user_settings_store
     ):
         """Create module dependencies with mocked modules"""
         return ModuleDependencies(
@@ -67,20 +69,32 @@ class TestSimpleUserSettingsModule:
             }
         )
 
-    @pytest.fixture
-    def config(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
         """Create test configuration"""
         return {}  # No database config needed since we use mock store
 
-    @pytest.fixture
-    def module(self, dependencies, config):
-        """Create a test module instance"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def module(cls, dependencies, config):
+        """Create a test module instance shared by all tests in the class"""
         return SimpleUserSettingsModule(dependencies, config)
 
+    @pytest.fixture(autouse=True)
+    def reset_state(
+        self,
+        mock_session_module: MockSessionModule,
+        mock_user_settings_store: InMemoryUserSettingsStore,
+    ):
+        """Forget the session and stored settings left behind by earlier tests"""
+        mock_session_module.mock_session = None
+        mock_user_settings_store.reset()
+
     @pytest.fixture
-    def mock_request(self):
-        """Create a mock request object"""
-        return MagicMock(spec=Request)
+    def http_request(self) -> Request:
+        """Create a bare request; the mock session module never inspects it"""
+        return Request({"type": "http", "method": "GET", "path": "/api/user"})
 
     def test_module_initialization_missing_session_dependency(self):
         """Test module raises error when session dependency is missing"""
@@ -109,21 +123,21 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_get_user_settings_empty(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test getting settings for user with no existing settings"""
         user_id = "test-user-123"
         session = Session(user_id=user_id, additional={})
         module.session_module.set_mock_session(session)
 
-        result = await module.get_user_settings(user_id, mock_request)
+        result = await module.get_user_settings(user_id, http_request)
 
         assert isinstance(result, UserSettingsResponse)
         assert result.settings == {}
 
     @pytest.mark.asyncio
     async def test_get_user_settings_unauthorized_access(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test user cannot access another user's settings"""
         user_id = "other-user-456"
@@ -131,27 +145,27 @@ class TestSimpleUserSettingsModule:
         module.session_module.set_mock_session(session)
 
         with pytest.raises(HTTPException) as exc_info:
-            await module.get_user_settings(user_id, mock_request)
+            await module.get_user_settings(user_id, http_request)
 
         assert exc_info.value.status_code == 403
         assert "only access your own data" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_get_user_settings_no_session(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test getting settings without valid session raises 401"""
         user_id = "test-user-123"
         # Don't set mock session, should raise 401
 
         with pytest.raises(HTTPException) as exc_info:
-            await module.get_user_settings(user_id, mock_request)
+            await module.get_user_settings(user_id, http_request)
 
         assert exc_info.value.status_code == 401
 
     @pytest.mark.asyncio
     async def test_update_user_settings_new_user(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test updating settings for user with no existing settings"""
         user_id = "test-user-123"
@@ -166,7 +180,7 @@ class TestSimpleUserSettingsModule:
         )
 
         result = await module.update_user_settings(
-            user_id, settings_update, mock_request
+            user_id, settings_update, http_request
         )
 
         assert isinstance(result, UserSettingsResponse)
@@ -176,7 +190,7 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_update_user_settings_existing_user(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test updating settings for user with existing settings (merge behavior)"""
         user_id = "test-user-123"
@@ -190,14 +204,14 @@ class TestSimpleUserSettingsModule:
                 "notifications": {"email_enabled": False, "push_enabled": True},
             }
         )
-        await module.update_user_settings(user_id, initial_settings, mock_request)
+        await module.update_user_settings(user_id, initial_settings, http_request)
 
         # Then update only theme settings
         update_settings = UserSettingsUpdateRequest(
             settings={"theme": {"mode": "dark", "primary_color": "#red"}}
         )
         result = await module.update_user_settings(
-            user_id, update_settings, mock_request
+            user_id, update_settings, http_request
         )
 
         assert isinstance(result, UserSettingsResponse)
@@ -210,7 +224,7 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_update_user_settings_unauthorized_modification(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test user cannot modify another user's settings"""
         user_id = "other-user-456"
@@ -222,14 +236,14 @@ class TestSimpleUserSettingsModule:
         )
 
         with pytest.raises(HTTPException) as exc_info:
-            await module.update_user_settings(user_id, settings_update, mock_request)
+            await module.update_user_settings(user_id, settings_update, http_request)
 
         assert exc_info.value.status_code == 403
         assert "only access your own data" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_update_user_settings_no_session(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test updating settings without valid session raises 401"""
         user_id = "test-user-123"
@@ -239,13 +253,13 @@ class TestSimpleUserSettingsModule:
         # Don't set mock session, should raise 401
 
         with pytest.raises(HTTPException) as exc_info:
-            await module.update_user_settings(user_id, settings_update, mock_request)
+            await module.update_user_settings(user_id, settings_update, http_request)
 
         assert exc_info.value.status_code == 401
 
     @pytest.mark.asyncio
     async def test_get_settings_after_update(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test full flow: update settings then retrieve them"""
         user_id = "test-user-123"
@@ -259,10 +273,10 @@ class TestSimpleUserSettingsModule:
                 "language": {"locale": "en-US", "timezone": "UTC"},
             }
         )
-        await module.update_user_settings(user_id, settings_update, mock_request)
+        await module.update_user_settings(user_id, settings_update, http_request)
 
         # Retrieve settings
-        result = await module.get_user_settings(user_id, mock_request)
+        result = await module.get_user_settings(user_id, http_request)
 
         assert isinstance(result, UserSettingsResponse)
         assert result.settings["theme"]["mode"] == "dark"
@@ -272,7 +286,7 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_get_user_setting_type_empty(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test getting a specific setting type for user with no existing settings"""
         user_id = "test-user-123"
@@ -280,14 +294,14 @@ class TestSimpleUserSettingsModule:
         session = Session(user_id=user_id, additional={})
         module.session_module.set_mock_session(session)
 
-        result = await module.get_user_setting_type(user_id, module_name, mock_request)
+        result = await module.get_user_setting_type(user_id, module_name, http_request)
 
         assert isinstance(result, UserSettingTypeResponse)
         assert result.settings == {}
 
     @pytest.mark.asyncio
     async def test_get_user_setting_type_existing(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test getting a specific setting type for user with existing settings"""
         user_id = "test-user-123"
@@ -302,10 +316,10 @@ class TestSimpleUserSettingsModule:
                 "notifications": {"email_enabled": True},
             }
         )
-        await module.update_user_settings(user_id, settings_update, mock_request)
+        await module.update_user_settings(user_id, settings_update, http_request)
 
         # Then get specific setting type
-        result = await module.get_user_setting_type(user_id, module_name, mock_request)
+        result = await module.get_user_setting_type(user_id, module_name, http_request)
 
         assert isinstance(result, UserSettingTypeResponse)
         assert result.settings["mode"] == "dark"
@@ -313,7 +327,7 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_get_user_setting_type_nonexistent(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test getting a non-existent setting type returns empty settings"""
         user_id = "test-user-123"
@@ -325,17 +339,17 @@ class TestSimpleUserSettingsModule:
         settings_update = UserSettingsUpdateRequest(
             settings={"theme": {"mode": "dark", "primary_color": "#1976d2"}}
         )
-        await module.update_user_settings(user_id, settings_update, mock_request)
+        await module.update_user_settings(user_id, settings_update, http_request)
 
         # Then get non-existent setting type
-        result = await module.get_user_setting_type(user_id, module_name, mock_request)
+        result = await module.get_user_setting_type(user_id, module_name, http_request)
 
         assert isinstance(result, UserSettingTypeResponse)
         assert result.settings == {}
 
     @pytest.mark.asyncio
     async def test_get_user_setting_type_unauthorized_access(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test user cannot access another user's specific setting type"""
         user_id = "other-user-456"
@@ -344,14 +358,14 @@ class TestSimpleUserSettingsModule:
         module.session_module.set_mock_session(session)
 
         with pytest.raises(HTTPException) as exc_info:
-            await module.get_user_setting_type(user_id, module_name, mock_request)
+            await module.get_user_setting_type(user_id, module_name, http_request)
 
         assert exc_info.value.status_code == 403
         assert "only access your own data" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_update_user_setting_type_new_user(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test updating a specific setting type for user with no existing settings"""
         user_id = "test-user-123"
@@ -364,7 +378,7 @@ class TestSimpleUserSettingsModule:
         )
 
         result = await module.update_user_setting_type(
-            user_id, module_name, settings_update, mock_request
+            user_id, module_name, settings_update, http_request
         )
 
         assert isinstance(result, UserSettingTypeResponse)
@@ -373,7 +387,7 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_update_user_setting_type_existing_user(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test updating a specific setting type for user with existing settings"""
         user_id = "test-user-123"
@@ -388,14 +402,14 @@ class TestSimpleUserSettingsModule:
                 "notifications": {"email_enabled": False},
             }
         )
-        await module.update_user_settings(user_id, initial_settings, mock_request)
+        await module.update_user_settings(user_id, initial_settings, http_request)
 
         # Then update specific setting type
         settings_update = UserSettingTypeUpdateRequest(
             settings={"mode": "dark", "primary_color": "#red", "sidebar": "collapsed"}
         )
         result = await module.update_user_setting_type(
-            user_id, module_name, settings_update, mock_request
+            user_id, module_name, settings_update, http_request
         )
 
         assert isinstance(result, UserSettingTypeResponse)
@@ -404,12 +418,12 @@ class TestSimpleUserSettingsModule:
         assert result.settings["sidebar"] == "collapsed"
 
         # Verify other settings are preserved
-        full_settings = await module.get_user_settings(user_id, mock_request)
+        full_settings = await module.get_user_settings(user_id, http_request)
         assert not full_settings.settings["notifications"]["email_enabled"]
 
     @pytest.mark.asyncio
     async def test_update_user_setting_type_unauthorized_modification(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test user cannot modify another user's specific setting type"""
         user_id = "other-user-456"
@@ -421,7 +435,7 @@ class TestSimpleUserSettingsModule:
 
         with pytest.raises(HTTPException) as exc_info:
             await module.update_user_setting_type(
-                user_id, module_name, settings_update, mock_request
+                user_id, module_name, settings_update, http_request
             )
 
         assert exc_info.value.status_code == 403
@@ -429,7 +443,7 @@ class TestSimpleUserSettingsModule:
 
     @pytest.mark.asyncio
     async def test_setting_type_flow_integration(
-        self, module: UserSettingsModule, mock_request
+        self, module: UserSettingsModule, http_request
     ):
         """Test full flow: update specific setting type then retrieve it"""
         user_id = "test-user-123"
@@ -446,12 +460,12 @@ class TestSimpleUserSettingsModule:
             }
         )
         update_result = await module.update_user_setting_type(
-            user_id, module_name, settings_update, mock_request
+            user_id, module_name, settings_update, http_request
         )
 
         # Retrieve specific setting type
         get_result = await module.get_user_setting_type(
-            user_id, module_name, mock_request
+            user_id, module_name, http_request
         )
 
         assert isinstance(get_result, UserSettingTypeResponse)
@@ -6,6 +6,8 @@ Tests both the abstract module interface and the SQLAlchemy implementation.
 
 from abc import ABC, abstractmethod
 import pytest
+import pytest_asyncio
+from sqlalchemy import event
 
 from modai.module import ModuleDependencies
 from modai.modules.user_settings_store.inmemory_user_settings_store import (
@@ -16,13 +18,21 @@ from modai.modules.user_settings_store.sqlalchemy_user_settings_store import (
     SQLAlchemyUserSettingsStore,
 )
 
+USER_ID = "test-user-123"
 
-class TestSQLAlchemyUserSettingsStore(ABC):
-    """Test the SQLAlchemy UserSettingsStore implementation"""
 
-    @pytest.fixture
-    def dependencies(self):
-        """Create module dependencies"""
+class AbstractUserSettingsStoreTestBase(ABC):
+    """
+    Abstract base class for testing UserSettingsStore implementations.
+
+    Subclasses must provide the store fixture with the specific
+    UserSettingsStore implementation to be tested.
+    """
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dependencies(cls):
+        """Create module dependencies shared by every test in the class"""
         return ModuleDependencies(modules={})
 
     @pytest.fixture
@@ -31,52 +41,43 @@ class TestSQLAlchemyUserSettingsStore(ABC):
         """Create a test store instance with patched _table_to_user_settings method"""
         pass
 
+    @pytest_asyncio.fixture
+    async def seeded_store(self, store: UserSettingsStore) -> UserSettingsStore:
+        """Store that already holds theme and notification settings for USER_ID"""
+        await store.update_user_settings(
+            USER_ID,
+            {
+                "theme": {"mode": "light", "primary_color": "#blue"},
+                "notifications": {"email_enabled": False, "push_enabled": True},
+            },
+        )
+        return store
+
     @pytest.mark.asyncio
     async def test_get_user_settings_empty(self, store: UserSettingsStore):
         """Test getting settings for user with no existing settings"""
-        user_id = "test-user-123"
-
-        result = await store.get_user_settings(user_id)
+        result = await store.get_user_settings(USER_ID)
 
         assert result == {}
 
-    @pytest.mark.asyncio
-    async def test_get_user_settings_invalid_user_id(self, store: UserSettingsStore):
-        """Test getting settings with invalid user_id raises error"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.get_user_settings("")
-
     @pytest.mark.asyncio
     async def test_get_user_setting_by_module_empty(self, store: UserSettingsStore):
         """Test getting specific module settings for user with no settings"""
-        user_id = "test-user-123"
         module_name = "theme"
 
-        result = await store.get_user_setting_by_module(user_id, module_name)
+        result = await store.get_user_setting_by_module(USER_ID, module_name)
 
         assert result == {}
 
-    @pytest.mark.asyncio
-    async def test_get_user_setting_by_module_invalid_params(
-        self, store: UserSettingsStore
-    ):
-        """Test getting module settings with invalid parameters raises errors"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.get_user_setting_by_module("", "theme")
-
-        with pytest.raises(ValueError, match="module_name cannot be empty"):
-            await store.get_user_setting_by_module("user123", "")
-
     @pytest.mark.asyncio
     async def test_update_user_settings_new_user(self, store: UserSettingsStore):
         """Test updating settings for new user"""
-        user_id = "test-user-123"
         settings = {
             "theme": {"mode": "dark", "primary_color": "#1976d2"},
             "notifications": {"email_enabled": True},
         }
 
-        result = await store.update_user_settings(user_id, settings)
+        result = await store.update_user_settings(USER_ID, settings)
 
         assert isinstance(result, dict)
         assert result["theme"]["mode"] == "dark"
@@ -84,20 +85,13 @@ class TestSQLAlchemyUserSettingsStore(ABC):
         assert result["notifications"]["email_enabled"]
 
     @pytest.mark.asyncio
-    async def test_update_user_settings_existing_user(self, store: UserSettingsStore):
+    async def test_update_user_settings_existing_user(
+        self, seeded_store: UserSettingsStore
+    ):
         """Test updating settings for existing user (merge behavior)"""
-        user_id = "test-user-123"
-
-        # First, create initial settings
-        initial_settings = {
-            "theme": {"mode": "light", "primary_color": "#blue"},
-            "notifications": {"email_enabled": False, "push_enabled": True},
-        }
-        await store.update_user_settings(user_id, initial_settings)
-
-        # Then update only theme settings
+        # Update only theme settings
         update_settings = {"theme": {"mode": "dark", "primary_color": "#red"}}
-        result = await store.update_user_settings(user_id, update_settings)
+        result = await seeded_store.update_user_settings(USER_ID, update_settings)
 
         assert isinstance(result, dict)
         # Theme should be updated
@@ -107,26 +101,16 @@ class TestSQLAlchemyUserSettingsStore(ABC):
         assert not result["notifications"]["email_enabled"]
         assert result["notifications"]["push_enabled"]
 
-    @pytest.mark.asyncio
-    async def test_update_user_settings_invalid_params(self, store: UserSettingsStore):
-        """Test updating settings with invalid parameters raises errors"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.update_user_settings("", {})
-
-        with pytest.raises(ValueError, match="settings must be a dictionary"):
-            await store.update_user_settings("user123", "not a dict")
-
     @pytest.mark.asyncio
     async def test_update_user_setting_by_module_new_user(
         self, store: UserSettingsStore
     ):
         """Test updating specific module settings for new user"""
-        user_id = "test-user-123"
         module_name = "theme"
         setting_data = {"mode": "dark", "primary_color": "#1976d2"}
 
         result = await store.update_user_setting_by_module(
-            user_id, module_name, setting_data
+            USER_ID, module_name, setting_data
         )
 
         assert isinstance(result, dict)
@@ -134,173 +118,165 @@ class TestSQLAlchemyUserSettingsStore(ABC):
 
     @pytest.mark.asyncio
     async def test_update_user_setting_by_module_existing_user(
-        self, store: UserSettingsStore
+        self, seeded_store: UserSettingsStore
     ):
         """Test updating specific module settings for existing user"""
-        user_id = "test-user-123"
-
-        # First, create initial settings
-        initial_settings = {
-            "theme": {"mode": "light", "primary_color": "#blue"},
-            "notifications": {"email_enabled": False},
-        }
-        await store.update_user_settings(user_id, initial_settings)
-
-        # Then update specific module settings
+        # Update specific module settings
         module_name = "theme"
         setting_data = {"mode": "dark", "primary_color": "#red", "sidebar": "collapsed"}
-        result = await store.update_user_setting_by_module(
-            user_id, module_name, setting_data
+        result = await seeded_store.update_user_setting_by_module(
+            USER_ID, module_name, setting_data
         )
 
         assert isinstance(result, dict)
         assert result == setting_data
 
         # Verify all settings are properly stored
-        all_settings = await store.get_user_settings(user_id)
+        all_settings = await seeded_store.get_user_settings(USER_ID)
         assert all_settings["theme"] == setting_data
         # Other settings should remain unchanged
         assert not all_settings["notifications"]["email_enabled"]
 
     @pytest.mark.asyncio
-    async def test_update_user_setting_by_module_invalid_params(
-        self, store: UserSettingsStore
-    ):
-        """Test updating module settings with invalid parameters raises errors"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.update_user_setting_by_module("", "theme", {})
-
-        with pytest.raises(ValueError, match="module_name cannot be empty"):
-            await store.update_user_setting_by_module("user123", "", {})
-
-        with pytest.raises(ValueError, match="setting_data must be a dictionary"):
-            await store.update_user_setting_by_module("user123", "theme", "not a dict")
-
-    @pytest.mark.asyncio
-    async def test_get_settings_after_update(self, store: UserSettingsStore):
+    async def test_get_settings_after_update(self, seeded_store: UserSettingsStore):
         """Test full flow: update settings then retrieve them"""
-        user_id = "test-user-123"
-
-        # Update settings
-        settings = {
-            "theme": {"mode": "dark", "sidebar": "collapsed"},
-            "language": {"locale": "en-US", "timezone": "UTC"},
-        }
-        await store.update_user_settings(user_id, settings)
-
         # Retrieve all settings
-        result = await store.get_user_settings(user_id)
+        result = await seeded_store.get_user_settings(USER_ID)
 
         assert isinstance(result, dict)
-        assert result["theme"]["mode"] == "dark"
-        assert result["theme"]["sidebar"] == "collapsed"
-        assert result["language"]["locale"] == "en-US"
-        assert result["language"]["timezone"] == "UTC"
+        assert result["theme"]["mode"] == "light"
+        assert result["theme"]["primary_color"] == "#blue"
+        assert not result["notifications"]["email_enabled"]
+        assert result["notifications"]["push_enabled"]
 
         # Retrieve specific module settings
-        theme_result = await store.get_user_setting_by_module(user_id, "theme")
-        assert theme_result["mode"] == "dark"
-        assert theme_result["sidebar"] == "collapsed"
+        theme_result = await seeded_store.get_user_setting_by_module(USER_ID, "theme")
+        assert theme_result["mode"] == "light"
+        assert theme_result["primary_color"] == "#blue"
 
     @pytest.mark.asyncio
-    async def test_delete_user_settings(self, store: UserSettingsStore):
+    async def test_delete_user_settings(self, seeded_store: UserSettingsStore):
         """Test deleting all user settings"""
-        user_id = "test-user-123"
-
-        # Create settings first
-        settings = {"theme": {"mode": "dark"}}
-        await store.update_user_settings(user_id, settings)
-
-        # Verify settings exist
-        result = await store.get_user_settings(user_id)
-        assert result["theme"]["mode"] == "dark"
-
         # Delete settings
-        await store.delete_user_settings(user_id)
+        await seeded_store.delete_user_settings(USER_ID)
 
         # Verify settings are gone
-        result = await store.get_user_settings(user_id)
+        result = await seeded_store.get_user_settings(USER_ID)
         assert result == {}
 
     @pytest.mark.asyncio
-    async def test_delete_user_settings_invalid_user_id(self, store: UserSettingsStore):
-        """Test deleting settings with invalid user_id raises error"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.delete_user_settings("")
-
-    @pytest.mark.asyncio
-    async def test_delete_user_setting_by_module(self, store: UserSettingsStore):
+    async def test_delete_user_setting_by_module(self, seeded_store: UserSettingsStore):
         """Test deleting specific module settings"""
-        user_id = "test-user-123"
-
-        # Create settings first
-        settings = {"theme": {"mode": "dark"}, "notifications": {"email_enabled": True}}
-        await store.update_user_settings(user_id, settings)
-
         # Delete specific module settings
-        await store.delete_user_setting_by_module(user_id, "theme")
+        await seeded_store.delete_user_setting_by_module(USER_ID, "theme")
 
         # Verify the setting was deleted
-        remaining_settings = await store.get_user_settings(user_id)
+        remaining_settings = await seeded_store.get_user_settings(USER_ID)
         assert "theme" not in remaining_settings
-        assert remaining_settings["notifications"]["email_enabled"]
+        assert remaining_settings["notifications"]["push_enabled"]
 
     @pytest.mark.asyncio
     async def test_delete_last_setting_by_module(self, store: UserSettingsStore):
         """Test deleting the last module settings removes entire record"""
-        user_id = "test-user-123"
-
         # Create settings with only one module
         settings = {"theme": {"mode": "dark"}}
-        await store.update_user_settings(user_id, settings)
+        await store.update_user_settings(USER_ID, settings)
 
         # Delete the only module settings
-        await store.delete_user_setting_by_module(user_id, "theme")
+        await store.delete_user_setting_by_module(USER_ID, "theme")
 
         # Verify user has no settings left
-        remaining_settings = await store.get_user_settings(user_id)
+        remaining_settings = await store.get_user_settings(USER_ID)
         assert remaining_settings == {}
 
-    @pytest.mark.asyncio
-    async def test_delete_user_setting_by_module_invalid_params(
-        self, store: UserSettingsStore
-    ):
-        """Test deleting module settings with invalid parameters raises errors"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.delete_user_setting_by_module("", "theme")
-
-        with pytest.raises(ValueError, match="module_name cannot be empty"):
-            await store.delete_user_setting_by_module("user123", "")
-
     @pytest.mark.asyncio
     async def test_user_has_settings(self, store: UserSettingsStore):
         """Test checking if user has settings"""
-        user_id = "test-user-123"
-
         # Initially no settings
-        result = await store.user_has_settings(user_id)
-        assert not result
+        result = await store.user_has_settings(USER_ID)
+        assert result is False
 
         # Add settings
         settings = {"theme": {"mode": "dark"}}
-        await store.update_user_settings(user_id, settings)
+        await store.update_user_settings(USER_ID, settings)
 
         # Should have settings now
-        result = await store.user_has_settings(user_id)
-        assert result
+        result = await store.user_has_settings(USER_ID)
+        assert result is True
 
         # Delete settings
-        await store.delete_user_settings(user_id)
+        await store.delete_user_settings(USER_ID)
 
         # Should not have settings anymore
-        result = await store.user_has_settings(user_id)
-        assert not result
+        result = await store.user_has_settings(USER_ID)
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_user_has_settings_invalid_user_id(self, store: UserSettingsStore):
-        """Test checking settings with invalid user_id raises error"""
-        with pytest.raises(ValueError, match="user_id cannot be empty"):
-            await store.user_has_settings("")
+    @pytest.mark.parametrize(
+        "method,args,match",
+        [
+            ("get_user_settings", ("",), "user_id cannot be empty"),
+            ("get_user_setting_by_module", ("", "theme"), "user_id cannot be empty"),
+            (
+                "get_user_setting_by_module",
+                (USER_ID, ""),
+                "module_name cannot be empty",
+            ),
+            ("update_user_settings", ("", {}), "user_id cannot be empty"),
+            (
+                "update_user_settings",
+                (USER_ID, "not a dict"),
+                "settings must be a dictionary",
+            ),
+            (
+                "update_user_setting_by_module",
+                ("", "theme", {}),
+                "user_id cannot be empty",
+            ),
+            (
+                "update_user_setting_by_module",
+                (USER_ID, "", {}),
+                "module_name cannot be empty",
+            ),
+            (
+                "update_user_setting_by_module",
+                (USER_ID, "theme", "not a dict"),
+                "setting_data must be a dictionary",
+            ),
+            ("delete_user_settings", ("",), "user_id cannot be empty"),
+            (
+                "delete_user_setting_by_module",
+                ("", "theme"),
+                "user_id cannot be empty",
+            ),
+            (
+                "delete_user_setting_by_module",
+                (USER_ID, ""),
+                "module_name cannot be empty",
+            ),
+            ("user_has_settings", ("",), "user_id cannot be empty"),
+        ],
+        ids=[
+            "get-empty-user",
+            "get-module-empty-user",
+            "get-module-empty-module",
+            "update-empty-user",
+            "update-non-dict-settings",
+            "update-module-empty-user",
+            "update-module-empty-module",
+            "update-module-non-dict-data",
+            "delete-empty-user",
+            "delete-module-empty-user",
+            "delete-module-empty-module",
+            "has-settings-empty-user",
+        ],
+    )
+    async def test_invalid_params_raise_value_error(
+        self, store: UserSettingsStore, method: str, args: tuple, match: str
+    ):
+        """Test that every store method rejects invalid parameters"""
+        with pytest.raises(ValueError, match=match):
+            await getattr(store, method)(*args)
 
     def test_migrate_data(self, store: UserSettingsStore):
         """Test migration method exists and can be called"""
@@ -309,18 +285,27 @@ class TestSQLAlchemyUserSettingsStore(ABC):
         store.migrate_data("1.1.0", "1.0.0")
 
 
-class TestInmemoryUserSettingsStore(TestSQLAlchemyUserSettingsStore):
+class TestInmemoryUserSettingsStore(AbstractUserSettingsStoreTestBase):
     @pytest.fixture
     def store(self, dependencies):
         """Create a test store instance with patched _table_to_user_settings method"""
         return InMemoryUserSettingsStore(dependencies, {})
 
+    @pytest.mark.asyncio
+    async def test_reset_removes_all_settings(self, store: UserSettingsStore):
+        """Test that reset leaves the store empty"""
+        await store.update_user_settings(USER_ID, {"theme": {"mode": "dark"}})
+
+        store.reset()
 
-class TestSQLAlchemyUserSettingsStore(TestSQLAlchemyUserSettingsStore):
+        assert await store.user_has_settings(USER_ID) is False
+
+
+class TestSQLAlchemyUserSettingsStore(AbstractUserSettingsStoreTestBase):
     @pytest.fixture
     def store(self, dependencies):
         """Create a test store instance with patched _table_to_user_settings method"""
-        config = {"database_url": "sqlite:///:memory:", "echo": True}
+        config = {"database_url": "sqlite:///:memory:", "echo": False}
         return SQLAlchemyUserSettingsStore(dependencies, config)
 
     def test_store_initialization_default_database_url(self, dependencies):
@@ -331,3 +316,21 @@ class TestSQLAlchemyUserSettingsStore(TestSQLAlchemyUserSettingsStore):
             match="SQLAlchemyUserSettingsStore requires 'database_url' to be specified in config",
         ):
             SQLAlchemyUserSettingsStore(dependencies, config)
+
+    @pytest.mark.asyncio
+    async def test_user_has_settings_issues_exists_query(
+        self, seeded_store: SQLAlchemyUserSettingsStore
+    ):
+        """Test that user_has_settings asks for existence instead of loading rows"""
+        statements = []
+        event.listen(
+            seeded_store.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        assert await seeded_store.user_has_settings(USER_ID) is True
+
+        assert len(statements) == 1
+        assert "EXISTS" in statements[0]
+        assert "setting_data" not in statements[0]
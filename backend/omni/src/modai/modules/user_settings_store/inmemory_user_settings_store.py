@@ -8,9 +8,10 @@ from typing import Any, Dict
 
 from modai.module import ModuleDependencies
 from modai.modules.user_settings_store.module import UserSettingsStore
+from modai.modules.reset.resettable import Resettable
 
 
-class InMemoryUserSettingsStore(UserSettingsStore):
+class InMemoryUserSettingsStore(UserSettingsStore, Resettable):
     """
     In-memory implementation of the UserSettingsStore module.
 
@@ -121,6 +122,11 @@ class InMemoryUserSettingsStore(UserSettingsStore):
         user_settings = self.storage.get(user_id)
         return user_settings is not None and bool(user_settings)
 
+    # Resettable implementation
+    def reset(self) -> None:
+        """Remove all user settings from memory."""
+        self.storage = {}
+
     # Persistence Module implementation
     def migrate_data(self, software_version: str, previous_version: str | None) -> None:
         """
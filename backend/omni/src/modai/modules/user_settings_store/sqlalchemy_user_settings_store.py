@@ -16,6 +16,7 @@ from sqlalchemy import (
     DateTime,
     select,
     delete,
+    exists,
 )
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -106,17 +107,12 @@ class SQLAlchemyUserSettingsStore(UserSettingsStore, PersistenceModule, Resettab
         self._validate_module_name(module_name)
 
         with self._get_session() as session:
-            statement = select(self.user_settings_table).where(
+            statement = select(self.user_settings_table.c.setting_data).where(
                 self.user_settings_table.c.user_id == user_id,
                 self.user_settings_table.c.module_name == module_name,
             )
-            result = session.execute(statement)
-            settings_record = result.fetchone()
-
-            if settings_record and settings_record.setting_data:
-                return settings_record.setting_data
-            else:
-                return {}
+            setting_data = session.execute(statement).scalar_one_or_none()
+            return setting_data or {}
 
     async def update_user_settings(
         self, user_id: str, settings: Dict[str, Dict[str, Any]]
@@ -240,12 +236,10 @@ class SQLAlchemyUserSettingsStore(UserSettingsStore, PersistenceModule, Resettab
         self._validate_user_id(user_id)
 
         with self._get_session() as session:
-            statement = select(self.user_settings_table).where(
-                self.user_settings_table.c.user_id == user_id
+            statement = select(
+                exists().where(self.user_settings_table.c.user_id == user_id)
             )
-            result = session.execute(statement)
-            settings_record = result.fetchone()
-            return settings_record is not None
+            return session.execute(statement).scalar()
 
     # Resettable implementation
     def reset(self) -> None:
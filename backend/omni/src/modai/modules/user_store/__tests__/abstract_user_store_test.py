@@ -10,16 +10,42 @@ from abc import ABC, abstractmethod
 from modai.modules.user_store.module import UserStore
 
 
+async def populate_user_store(user_store: UserStore) -> None:
+    """Create Alice (admins, users) and Bob (users), both with passwords"""
+    user1 = await user_store.create_user(
+        email="alice@example.com", full_name="Alice Smith"
+    )
+    user2 = await user_store.create_user(email="bob@example.com", full_name="Bob Jones")
+
+    group1 = await user_store.create_group(
+        name="admins", description="Administrator group"
+    )
+    group2 = await user_store.create_group(
+        name="users", description="Regular users group"
+    )
+
+    await user_store.add_user_to_group(user1.id, group1.id)  # Alice is admin
+    await user_store.add_user_to_group(user1.id, group2.id)  # Alice is also user
+    await user_store.add_user_to_group(user2.id, group2.id)  # Bob is user
+
+    # Adding a user to a group they're already in must not raise
+    await user_store.add_user_to_group(user1.id, group1.id)
+
+    await user_store.set_user_password(user1.id, "hashed_alice_password")
+    await user_store.set_user_password(user2.id, "hashed_bob_password")
+
+
 class AbstractUserStoreTestBase(ABC):
     """
     Abstract base class for testing UserStore implementations.
 
-    Subclasses must implement the create_user_store() method to provide
+    Subclasses must implement the create_user_store() classmethod to provide
     the specific UserStore implementation to be tested.
     """
 
+    @classmethod
     @abstractmethod
-    def create_user_store(self) -> UserStore:
+    def create_user_store(cls) -> UserStore:
         """Create and return a UserStore instance for testing"""
         pass
 
@@ -28,140 +54,172 @@ class AbstractUserStoreTestBase(ABC):
         """Fixture providing a UserStore instance"""
         return self.create_user_store()
 
-    @pytest.mark.anyio
-    async def test_user_store_integration(self, user_store):
-        """Integration test for the UserStore implementation"""
-
-        # Create users
-        user1 = await user_store.create_user(
-            email="alice@example.com", full_name="Alice Smith"
-        )
-        user2 = await user_store.create_user(
-            email="bob@example.com", full_name="Bob Jones"
-        )
+    @pytest.fixture(scope="class")
+    @classmethod
+    async def populated_store(cls, anyio_backend):
+        """Populated UserStore shared by the read-only tests of a class"""
+        user_store = cls.create_user_store()
+        await populate_user_store(user_store)
+        return user_store
 
-        # Create groups
-        group1 = await user_store.create_group(
-            name="admins", description="Administrator group"
-        )
-        group2 = await user_store.create_group(
-            name="users", description="Regular users group"
-        )
-
-        # Add users to groups
-        await user_store.add_user_to_group(user1.id, group1.id)  # Alice is admin
-        await user_store.add_user_to_group(user1.id, group2.id)  # Alice is also user
-        await user_store.add_user_to_group(user2.id, group2.id)  # Bob is user
-
-        # Test idempotent behavior - adding user to group they're already in should not raise
-        await user_store.add_user_to_group(
-            user1.id, group1.id
-        )  # Alice already in admin group
+    @pytest.fixture
+    async def fresh_populated_store(self, anyio_backend):
+        """Populated UserStore for tests that modify its contents"""
+        user_store = self.create_user_store()
+        await populate_user_store(user_store)
+        return user_store
 
-        # Set passwords
-        await user_store.set_user_password(user1.id, "hashed_alice_password")
-        await user_store.set_user_password(user2.id, "hashed_bob_password")
+    @pytest.mark.anyio
+    async def test_get_user_by_email(self, populated_store):
+        retrieved_user = await populated_store.get_user_by_email("alice@example.com")
+        assert retrieved_user is not None
+        assert retrieved_user.email == "alice@example.com"
 
-        # Test retrieval operations
-        retrieved_user1 = await user_store.get_user_by_email("alice@example.com")
-        assert retrieved_user1 is not None
-        assert retrieved_user1.email == "alice@example.com"
+    @pytest.mark.anyio
+    async def test_get_group_by_name(self, populated_store):
+        retrieved_group = await populated_store.get_group_by_name("admins")
+        assert retrieved_group is not None
+        assert retrieved_group.name == "admins"
 
-        retrieved_group1 = await user_store.get_group_by_name("admins")
-        assert retrieved_group1 is not None
-        assert retrieved_group1.name == "admins"
+    @pytest.mark.anyio
+    async def test_get_user_groups(self, populated_store):
+        alice = await populated_store.get_user_by_email("alice@example.com")
 
-        # Test group membership
-        alice_groups = await user_store.get_user_groups(user1.id)
+        alice_groups = await populated_store.get_user_groups(alice.id)
         assert len(alice_groups) == 2
-        group_names = {g.name for g in alice_groups}
-        assert group_names == {"admins", "users"}
+        assert {g.name for g in alice_groups} == {"admins", "users"}
 
-        admin_users = await user_store.get_group_users(group1.id)
-        assert len(admin_users) == 1
-        assert admin_users[0].email == "alice@example.com"
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "group_name,expected_emails",
+        [
+            ("admins", {"alice@example.com"}),
+            ("users", {"alice@example.com", "bob@example.com"}),
+        ],
+    )
+    async def test_get_group_users(self, populated_store, group_name, expected_emails):
+        group = await populated_store.get_group_by_name(group_name)
+
+        group_users = await populated_store.get_group_users(group.id)
+        assert len(group_users) == len(expected_emails)
+        assert {u.email for u in group_users} == expected_emails
 
-        user_group_users = await user_store.get_group_users(group2.id)
-        assert len(user_group_users) == 2
-        emails = {u.email for u in user_group_users}
-        assert emails == {"alice@example.com", "bob@example.com"}
+    @pytest.mark.anyio
+    async def test_get_user_credentials(self, populated_store):
+        alice = await populated_store.get_user_by_email("alice@example.com")
 
-        # Test password verification
-        alice_credentials = await user_store.get_user_credentials(user1.id)
+        alice_credentials = await populated_store.get_user_credentials(alice.id)
         assert alice_credentials is not None
         assert alice_credentials.password_hash == "hashed_alice_password"
 
-        # Test listing
-        all_users = await user_store.list_users()
-        assert len(all_users) == 2
+    @pytest.mark.anyio
+    async def test_list_users_and_groups(self, populated_store):
+        assert len(await populated_store.list_users()) == 2
+        assert len(await populated_store.list_groups()) == 2
 
-        all_groups = await user_store.list_groups()
-        assert len(all_groups) == 2
+    @pytest.mark.anyio
+    async def test_update_user(self, fresh_populated_store):
+        alice = await fresh_populated_store.get_user_by_email("alice@example.com")
 
-        # Test updates
-        updated_user = await user_store.update_user(user1.id, full_name="Alice Johnson")
+        updated_user = await fresh_populated_store.update_user(
+            alice.id, full_name="Alice Johnson"
+        )
         assert updated_user is not None
         assert updated_user.full_name == "Alice Johnson"
 
-        # Test removal from group
-        await user_store.remove_user_from_group(user1.id, group1.id)  # Should not raise
+    @pytest.mark.anyio
+    async def test_remove_user_from_group(self, fresh_populated_store):
+        alice = await fresh_populated_store.get_user_by_email("alice@example.com")
+        admins = await fresh_populated_store.get_group_by_name("admins")
+
+        await fresh_populated_store.remove_user_from_group(alice.id, admins.id)
 
-        alice_groups_after = await user_store.get_user_groups(user1.id)
+        alice_groups_after = await fresh_populated_store.get_user_groups(alice.id)
         assert len(alice_groups_after) == 1
         assert alice_groups_after[0].name == "users"
 
-        # Test deletion
-        await user_store.delete_user(user2.id)  # Should not raise
+    @pytest.mark.anyio
+    async def test_delete_user_removes_group_memberships(self, fresh_populated_store):
+        bob = await fresh_populated_store.get_user_by_email("bob@example.com")
+        users = await fresh_populated_store.get_group_by_name("users")
+
+        await fresh_populated_store.delete_user(bob.id)  # Should not raise
 
-        remaining_users = await user_store.list_users()
+        remaining_users = await fresh_populated_store.list_users()
         assert len(remaining_users) == 1
         assert remaining_users[0].email == "alice@example.com"
 
         # Verify Bob is removed from all groups
-        users_group_after_deletion = await user_store.get_group_users(group2.id)
+        users_group_after_deletion = await fresh_populated_store.get_group_users(
+            users.id
+        )
         assert len(users_group_after_deletion) == 1
         assert users_group_after_deletion[0].email == "alice@example.com"
 
     @pytest.mark.anyio
-    async def test_user_store_error_cases(self, user_store):
-        """Test error cases and edge conditions"""
-
-        # Test duplicate email
-        await user_store.create_user(email="testuser@example.com")
+    @pytest.mark.parametrize(
+        "method,kwargs,match",
+        [
+            (
+                "create_user",
+                {"email": "testuser@example.com"},
+                "Email 'testuser@example.com' already exists",
+            ),
+            (
+                "create_group",
+                {"name": "testgroup"},
+                "Group name 'testgroup' already exists",
+            ),
+        ],
+        ids=["duplicate-email", "duplicate-group"],
+    )
+    async def test_create_duplicate_raises(self, user_store, method, kwargs, match):
+        """Test that creating a second user or group with the same key raises"""
+        create = getattr(user_store, method)
+        await create(**kwargs)
+
+        with pytest.raises(ValueError, match=match):
+            await create(**kwargs)
 
-        with pytest.raises(
-            ValueError, match="Email 'testuser@example.com' already exists"
-        ):
-            await user_store.create_user(email="testuser@example.com")
-
-        # Test duplicate group name
-        await user_store.create_group(name="testgroup")
-
-        with pytest.raises(ValueError, match="Group name 'testgroup' already exists"):
-            await user_store.create_group(name="testgroup")
-
-        # Test operations on non-existent entities
-        result = await user_store.get_user_by_id("nonexistent")
-        assert result is None
-
-        result = await user_store.update_user("nonexistent", full_name="Test")
-        assert result is None
-
-        # Test that idempotent operations don't raise exceptions
-        # These operations should succeed silently if the desired state is already achieved
-        await user_store.delete_user("nonexistent")  # Should not raise
-        await user_store.delete_group("nonexistent")  # Should not raise
-        await user_store.remove_user_from_group(
-            "nonexistent", "somegroup"
-        )  # Should not raise
-        await user_store.delete_user_credentials("nonexistent")  # Should not raise
-
-        # But operations that require existing entities should still raise exceptions
-        with pytest.raises(ValueError, match="User with ID 'nonexistent' not found"):
-            await user_store.set_user_password("nonexistent", "password")
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "method,args,kwargs",
+        [
+            ("get_user_by_id", ("nonexistent",), {}),
+            ("update_user", ("nonexistent",), {"full_name": "Test"}),
+            ("delete_user", ("nonexistent",), {}),
+            ("delete_group", ("nonexistent",), {}),
+            ("remove_user_from_group", ("nonexistent", "somegroup"), {}),
+            ("delete_user_credentials", ("nonexistent",), {}),
+        ],
+        ids=[
+            "get-user",
+            "update-user",
+            "delete-user",
+            "delete-group",
+            "remove-from-group",
+            "delete-credentials",
+        ],
+    )
+    async def test_nonexistent_entity_returns_none(
+        self, user_store, method, args, kwargs
+    ):
+        """Test that lookups and idempotent deletes of missing entities return None"""
+        assert await getattr(user_store, method)(*args, **kwargs) is None
 
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("set_user_password", ("nonexistent", "password")),
+            ("add_user_to_group", ("nonexistent", "somegroup")),
+        ],
+        ids=["set-password", "add-to-group"],
+    )
+    async def test_nonexistent_user_raises(self, user_store, method, args):
+        """Test that operations requiring an existing user raise for a missing one"""
         with pytest.raises(ValueError, match="User with ID 'nonexistent' not found"):
-            await user_store.add_user_to_group("nonexistent", "somegroup")
+            await getattr(user_store, method)(*args)
 
     @pytest.mark.anyio
     async def test_user_store_pagination(self, user_store):
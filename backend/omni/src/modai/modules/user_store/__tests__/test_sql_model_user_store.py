@@ -6,14 +6,12 @@ from modai.modules.user_store.__tests__.abstract_user_store_test import (
     AbstractUserStoreTestBase,
 )
 
-# Force anyio to use asyncio backend only
-anyio_backend = pytest.fixture(scope="session")(lambda: "asyncio")
-
 
 class TestSQLAlchemyUserStore(AbstractUserStoreTestBase):
     """Test class for SQLAlchemyUserStore using the abstract test base"""
 
-    def create_user_store(self):
+    @classmethod
+    def create_user_store(cls):
         """Create and return a SQLAlchemyUserStore instance for testing"""
         # Use in-memory SQLite database for testing
         return SQLAlchemyUserStore(
@@ -29,32 +27,15 @@ class TestSQLAlchemyUserStore(AbstractUserStoreTestBase):
         user_store.migrate_data("1.0.0", None)  # Should not raise
         user_store.migrate_data("1.1.0", "1.0.0")  # Should not raise
 
-    def test_sqlalchemy_requires_database_url(self):
+    @pytest.mark.parametrize(
+        "config",
+        [{}, {"database_url": None}, {"database_url": ""}],
+        ids=["missing", "none", "empty"],
+    )
+    def test_sqlalchemy_requires_database_url(self, config: dict):
         """Test that SQLAlchemyUserStore requires database_url in config"""
-
-        # Test with missing database_url
-        with pytest.raises(
-            ValueError,
-            match="SQLAlchemyUserStore requires 'database_url' to be specified in config",
-        ):
-            SQLAlchemyUserStore(ModuleDependencies(), {})
-
-        # Test with None database_url
         with pytest.raises(
             ValueError,
             match="SQLAlchemyUserStore requires 'database_url' to be specified in config",
         ):
-            SQLAlchemyUserStore(ModuleDependencies(), {"database_url": None})
-
-        # Test with empty string database_url
-        with pytest.raises(
-            ValueError,
-            match="SQLAlchemyUserStore requires 'database_url' to be specified in config",
-        ):
-            SQLAlchemyUserStore(ModuleDependencies(), {"database_url": ""})
-
-        # Test that valid database_url works
-        user_store = SQLAlchemyUserStore(
-            ModuleDependencies(), {"database_url": "sqlite:///:memory:"}
-        )
-        assert user_store is not None
+            SQLAlchemyUserStore(ModuleDependencies(), config)